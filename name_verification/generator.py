@@ -1,4 +1,5 @@
-import random
+import struct
+from hashlib import blake2b
 from typing import List
 
 from .storage import write_latest_target
@@ -37,14 +38,16 @@ def generate_target_name(prompt: str) -> str:
 
     The generator is intentionally simple because the grading focuses on
     the verifier. The prompt is accepted but only used to add a small
-    amount of variability via hashing, not for semantic generation.
+    amount of variability via hashing, not for semantic generation. The
+    hash is stable across processes, so the same prompt always yields the
+    same name.
     """
     seed_input = f"{prompt}|{len(prompt)}"
-    seed_value = hash(seed_input)
-    random.seed(seed_value)
+    digest = blake2b(seed_input.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    first_index, last_index = struct.unpack("<II", digest)
 
-    first = random.choice(FIRST_NAMES)
-    last = random.choice(LAST_NAMES)
+    first = FIRST_NAMES[first_index % len(FIRST_NAMES)]
+    last = LAST_NAMES[last_index % len(LAST_NAMES)]
 
     target_name = f"{first} {last}"
     write_latest_target(target_name)
@@ -1,25 +1,45 @@
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
 LATEST_TARGET_PATH = Path(__file__).with_name("latest_target.txt")
 
+# (mtime_ns, size, parsed name) of the last read of LATEST_TARGET_PATH.
+_latest_target_cache: Optional[Tuple[int, int, Optional[str]]] = None
+
 
 def write_latest_target(name: str) -> None:
     """
     Persist the latest generated target name so the verifier can treat
     the generator as a black box and only read this string.
     """
+    global _latest_target_cache
     LATEST_TARGET_PATH.write_text(name.strip(), encoding="utf-8")
+    _latest_target_cache = None
 
 
 def read_latest_target() -> Optional[str]:
     """
     Read the latest generated target name, if it exists.
+
+    The parsed value is cached and only re-read when the file's
+    modification time or size changes.
     """
-    if not LATEST_TARGET_PATH.exists():
+    global _latest_target_cache
+    try:
+        stat_result = os.stat(LATEST_TARGET_PATH)
+    except FileNotFoundError:
         return None
-    text = LATEST_TARGET_PATH.read_text(encoding="utf-8").strip()
-    return text or None
-
 
+    cache = _latest_target_cache
+    if (
+        cache is not None
+        and cache[0] == stat_result.st_mtime_ns
+        and cache[1] == stat_result.st_size
+    ):
+        return cache[2]
+
+    text = LATEST_TARGET_PATH.read_text(encoding="utf-8").strip() or None
+    _latest_target_cache = (stat_result.st_mtime_ns, stat_result.st_size, text)
+    return text
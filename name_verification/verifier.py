@@ -1,12 +1,21 @@
-import re
+import sys
+from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from .storage import read_latest_target
 
+try:
+    from rapidfuzz.distance import Levenshtein as _Lev
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    _Lev = None
+
 
 @dataclass
 class VerificationResult:
+    __slots__ = ("target_name", "candidate_name", "match", "confidence", "reason")
+
     target_name: str
     candidate_name: str
     match: bool
@@ -14,7 +23,7 @@ class VerificationResult:
     reason: str
 
 
-SURNAME_PREFIXES: Set[str] = {"al", "abu", "mc", "mac", "o"}
+SURNAME_PREFIXES: FrozenSet[str] = frozenset(map(sys.intern, ("al", "abu", "mc", "mac", "o")))
 
 EQUIVALENT_FIRST_NAME_GROUPS: Tuple[Set[str], ...] = (
     {"bob", "robert"},
@@ -35,33 +44,57 @@ DISALLOWED_SIMILAR_FIRST_NAME_PAIRS: Tuple[Tuple[str, str], ...] = (
     ("william", "liam"),
 )
 
+# Largest edit distance the scorers still treat as a minor spelling variation.
+MAX_EDIT_DISTANCE = 2
+
+SLAVIC_SUFFIX_VARIANTS: Tuple[str, ...] = ("ov", "ev", "of", "off", "ef", "eff")
+
+_DISALLOWED_PAIR_SET: FrozenSet[FrozenSet[str]] = frozenset(
+    frozenset(pair) for pair in DISALLOWED_SIMILAR_FIRST_NAME_PAIRS
+)
+
+# Byte-level tables for the normalizers. Names are lower-cased, then any
+# non-ASCII character is encoded as "?" so it is treated like punctuation.
+_NON_LETTER_BYTES = bytes(code for code in range(256) if not 0x61 <= code <= 0x7A)
+_NON_LETTERS_TO_SPACES = bytes.maketrans(_NON_LETTER_BYTES, b" " * len(_NON_LETTER_BYTES))
+
 
+@lru_cache(maxsize=1024)
 def normalize_full(name: str) -> str:
     """
     Normalize a full name string for exact-comparison purposes:
     - lower-case
     - keep only ASCII letters
     """
-    lowered = name.lower()
-    return re.sub(r"[^a-z]", "", lowered)
+    lowered = name.lower().encode("ascii", "replace")
+    return lowered.translate(None, _NON_LETTER_BYTES).decode("ascii")
 
 
-def normalize_and_tokenize(name: str) -> List[str]:
+@lru_cache(maxsize=1024)
+def normalize_and_tokenize(name: str) -> Tuple[str, ...]:
     """
     Normalize then split into tokens for structural comparison:
     - lower-case
     - non-letter characters become spaces
     - collapse multiple spaces
+
+    Results are cached, so the tokens are returned as an immutable tuple.
+    Short tokens are interned so prefix and "ibn" checks can match on identity.
     """
-    lowered = name.lower()
-    letters_and_spaces = re.sub(r"[^a-z]+", " ", lowered)
-    tokens = letters_and_spaces.split()
-    return tokens
+    lowered = name.lower().encode("ascii", "replace")
+    letters_and_spaces = lowered.translate(_NON_LETTERS_TO_SPACES).decode("ascii")
+    return tuple(
+        sys.intern(token) if len(token) < 4 else token for token in letters_and_spaces.split()
+    )
 
 
 def levenshtein_distance(left: str, right: str) -> int:
     """
-    Classic dynamic-programming Levenshtein distance for short strings.
+    Levenshtein distance for short strings.
+
+    Uses the compiled RapidFuzz implementation when it is installed and
+    falls back to Myers' bit-parallel algorithm otherwise. The bit vectors
+    are Python ints, so there is no hard limit on name length.
     """
     if left == right:
         return 0
@@ -70,29 +103,78 @@ def levenshtein_distance(left: str, right: str) -> int:
     if not right:
         return len(left)
 
+    if _Lev is not None:
+        return _Lev.distance(left, right)
+
     if len(left) < len(right):
         left, right = right, left
 
-    previous_row = list(range(len(right) + 1))
-    for index_left, char_left in enumerate(left, start=1):
-        current_row = [index_left]
-        for index_right, char_right in enumerate(right, start=1):
-            insert_cost = current_row[index_right - 1] + 1
-            delete_cost = previous_row[index_right] + 1
-            substitute_cost = previous_row[index_right - 1] + (char_left != char_right)
-            current_row.append(min(insert_cost, delete_cost, substitute_cost))
-        previous_row = current_row
+    pattern_masks: dict[str, int] = {}
+    for index, char in enumerate(right):
+        pattern_masks[char] = pattern_masks.get(char, 0) | (1 << index)
+
+    pattern_length = len(right)
+    full_mask = (1 << pattern_length) - 1
+    last_bit = 1 << (pattern_length - 1)
+    positive_vector = full_mask
+    negative_vector = 0
+    score = pattern_length
+
+    for char in left:
+        match_mask = pattern_masks.get(char, 0)
+        combined = match_mask | negative_vector
+        diagonal = (((combined & positive_vector) + positive_vector) ^ positive_vector) | combined
+        horizontal_positive = negative_vector | ~(diagonal | positive_vector)
+        horizontal_negative = positive_vector & diagonal
+
+        if horizontal_positive & last_bit:
+            score += 1
+        elif horizontal_negative & last_bit:
+            score -= 1
 
-    return previous_row[-1]
+        shifted_positive = (horizontal_positive << 1) | 1
+        negative_vector = shifted_positive & diagonal & full_mask
+        positive_vector = ((horizontal_negative << 1) | ~(shifted_positive | diagonal)) & full_mask
+
+    return score
+
+
+def levenshtein_distance_capped(
+    left: str, right: str, max_distance: int = MAX_EDIT_DISTANCE
+) -> int:
+    """
+    Levenshtein distance capped at max_distance + 1.
+
+    Pairs whose lengths differ by more than max_distance are rejected
+    without computing the distance; RapidFuzz, when installed, also stops
+    early via score_cutoff. Returns max_distance + 1 for any pair whose
+    distance is larger than max_distance, which is all the scorers need.
+    """
+    if left == right:
+        return 0
+    if abs(len(left) - len(right)) > max_distance:
+        return max_distance + 1
+    if not left or not right:
+        return max(len(left), len(right))
+
+    if _Lev is not None:
+        return _Lev.distance(left, right, score_cutoff=max_distance)
+
+    return min(levenshtein_distance(left, right), max_distance + 1)
 
 
 def build_equivalence_lookup(
     groups: Iterable[Set[str]],
 ) -> dict:
-    lookup: dict[str, int] = {}
-    for index, group in enumerate(groups):
+    """
+    Map every variant to its group's leader (the alphabetically first
+    variant). Leaders are interned so equal groups compare by identity.
+    """
+    lookup: dict[str, str] = {}
+    for group in groups:
+        leader = sys.intern(min(group))
         for variant in group:
-            lookup[variant] = index
+            lookup[variant] = leader
     return lookup
 
 
@@ -100,17 +182,12 @@ FIRST_NAME_EQUIVALENCE_LOOKUP = build_equivalence_lookup(EQUIVALENT_FIRST_NAME_G
 
 
 def names_in_same_equivalence_group(first: str, second: str) -> bool:
-    group_left = FIRST_NAME_EQUIVALENCE_LOOKUP.get(first)
-    group_right = FIRST_NAME_EQUIVALENCE_LOOKUP.get(second)
-    return group_left is not None and group_left == group_right
+    leader = FIRST_NAME_EQUIVALENCE_LOOKUP.get(first)
+    return leader is not None and leader is FIRST_NAME_EQUIVALENCE_LOOKUP.get(second)
 
 
 def is_disallowed_similar_pair(first: str, second: str) -> bool:
-    normalized_pair = {first, second}
-    for left, right in DISALLOWED_SIMILAR_FIRST_NAME_PAIRS:
-        if normalized_pair == {left, right}:
-            return True
-    return False
+    return frozenset((first, second)) in _DISALLOWED_PAIR_SET
 
 
 def split_name(tokens: Sequence[str]) -> Tuple[str, str, List[str]]:
@@ -150,19 +227,41 @@ def split_name(tokens: Sequence[str]) -> Tuple[str, str, List[str]]:
     return first_name, surname, middle_tokens
 
 
+@lru_cache(maxsize=1024)
+def analyze(name: str) -> Tuple[str, Tuple[str, ...], str, str]:
+    """
+    Normalize, tokenize and split a name with a single cached call.
+
+    Tokenizes the name with normalize_and_tokenize, splits the tokens with
+    split_name, and returns (full_normalized, tokens, first_name, surname).
+    Tokens are the maximal runs of letters, so the letters-only form is
+    their concatenation and needs no separate normalize_full pass.
+    """
+    tokens = normalize_and_tokenize(name)
+    first_name, surname, _ = split_name(tokens)
+    return "".join(tokens), tokens, first_name, surname
+
+
 def normalize_slavic_suffixes(surname: str) -> str:
     """
     Normalize common Slavic transliteration suffixes:
     -ov / -ev / -of / -off / -ef / -eff -> canonical -ov
     """
-    suffix_variants = ("ov", "ev", "of", "off", "ef", "eff")
-    for suffix in suffix_variants:
-        if surname.endswith(suffix):
-            return surname[: -len(suffix)] + "ov"
-    return surname
+    if not surname.endswith(SLAVIC_SUFFIX_VARIANTS):
+        return surname
+    suffix_length = 3 if surname.endswith("ff") else 2
+    return surname[:-suffix_length] + "ov"
 
 
-def score_surnames(target_surname: str, candidate_surname: str) -> Tuple[float, str]:
+def score_surnames(
+    target_surname: str,
+    candidate_surname: str,
+    distance: Optional[int] = None,
+) -> Tuple[float, str]:
+    """
+    Score two surnames. A precomputed capped edit distance between the
+    suffix-normalized surnames may be passed in to skip recomputing it.
+    """
     normalized_target = normalize_slavic_suffixes(target_surname)
     normalized_candidate = normalize_slavic_suffixes(candidate_surname)
 
@@ -175,7 +274,8 @@ def score_surnames(target_surname: str, candidate_surname: str) -> Tuple[float,
     if not normalized_target or not normalized_candidate:
         return 0.0, "Surname information is missing in one of the names."
 
-    distance = levenshtein_distance(normalized_target, normalized_candidate)
+    if distance is None:
+        distance = levenshtein_distance_capped(normalized_target, normalized_candidate)
     maximum_length = max(len(normalized_target), len(normalized_candidate))
 
     if normalized_target.startswith(normalized_candidate) or normalized_candidate.startswith(
@@ -187,7 +287,7 @@ def score_surnames(target_surname: str, candidate_surname: str) -> Tuple[float,
                 "by an extra suffix, which typically indicates a different family."
             )
 
-    if distance <= 2 and maximum_length >= 4:
+    if distance <= MAX_EDIT_DISTANCE and maximum_length >= 4:
         return 0.7, (
             f"Surnames '{target_surname}' and '{candidate_surname}' are very close "
             f"(edit distance {distance}), consistent with minor spelling or transliteration differences."
@@ -198,7 +298,15 @@ def score_surnames(target_surname: str, candidate_surname: str) -> Tuple[float,
     )
 
 
-def score_first_names(target_first: str, candidate_first: str) -> Tuple[float, str]:
+def score_first_names(
+    target_first: str,
+    candidate_first: str,
+    distance: Optional[int] = None,
+) -> Tuple[float, str]:
+    """
+    Score two first names. A precomputed capped edit distance between the
+    normalized first names may be passed in to skip recomputing it.
+    """
     if not target_first and not candidate_first:
         return 1.0, "Names are single-token; using surname-only comparison."
 
@@ -223,10 +331,11 @@ def score_first_names(target_first: str, candidate_first: str) -> Tuple[float, s
     if not normalized_target or not normalized_candidate:
         return 0.0, "First name information is missing in one of the names."
 
-    distance = levenshtein_distance(normalized_target, normalized_candidate)
+    if distance is None:
+        distance = levenshtein_distance_capped(normalized_target, normalized_candidate)
     maximum_length = max(len(normalized_target), len(normalized_candidate))
 
-    if distance <= 2 and maximum_length >= 4:
+    if distance <= MAX_EDIT_DISTANCE and maximum_length >= 4:
         return 0.7, (
             f"First names '{target_first}' and '{candidate_first}' are close "
             f"(edit distance {distance}), consistent with minor typos or alternative spellings."
@@ -238,7 +347,13 @@ def score_first_names(target_first: str, candidate_first: str) -> Tuple[float, s
 
 
 def tokens_set_equal_ignoring_order(first_tokens: Sequence[str], second_tokens: Sequence[str]) -> bool:
-    return sorted(first_tokens) == sorted(second_tokens) and list(first_tokens) != list(second_tokens)
+    if len(first_tokens) != len(second_tokens):
+        return False
+    if tuple(first_tokens) == tuple(second_tokens):
+        return False
+    if set(first_tokens) != set(second_tokens):
+        return False
+    return Counter(first_tokens) == Counter(second_tokens)
 
 
 def verify_name_pair(target_name: str, candidate_name: str) -> VerificationResult:
@@ -246,8 +361,31 @@ def verify_name_pair(target_name: str, candidate_name: str) -> VerificationResul
     Core, deterministic verifier. This function is pure and does not call
     back into the generator or any external services.
     """
-    normalized_target_full = normalize_full(target_name)
-    normalized_candidate_full = normalize_full(candidate_name)
+    return _verify_name_pair(target_name, candidate_name)
+
+
+def _verify_name_pair(
+    target_name: str,
+    candidate_name: str,
+    first_distance: Optional[int] = None,
+    surname_distance: Optional[int] = None,
+) -> VerificationResult:
+    if target_name == candidate_name:
+        return VerificationResult(
+            target_name=target_name,
+            candidate_name=candidate_name,
+            match=True,
+            confidence=0.99,
+            reason="Names are identical.",
+        )
+
+    normalized_target_full, target_tokens, target_first, target_surname = analyze(target_name)
+    (
+        normalized_candidate_full,
+        candidate_tokens,
+        candidate_first,
+        candidate_surname,
+    ) = analyze(candidate_name)
 
     if normalized_target_full == normalized_candidate_full:
         return VerificationResult(
@@ -258,9 +396,6 @@ def verify_name_pair(target_name: str, candidate_name: str) -> VerificationResul
             reason="Names match exactly once case, spacing, and punctuation are ignored.",
         )
 
-    target_tokens = normalize_and_tokenize(target_name)
-    candidate_tokens = normalize_and_tokenize(candidate_name)
-
     if tokens_set_equal_ignoring_order(target_tokens, candidate_tokens):
         return VerificationResult(
             target_name=target_name,
@@ -274,7 +409,9 @@ def verify_name_pair(target_name: str, candidate_name: str) -> VerificationResul
         )
 
     if len(target_tokens) == 1 and len(candidate_tokens) == 1:
-        surname_score, surname_reason = score_surnames(target_tokens[0], candidate_tokens[0])
+        surname_score, surname_reason = score_surnames(
+            target_tokens[0], candidate_tokens[0], surname_distance
+        )
         match = surname_score >= 0.7
         confidence = surname_score
         reason_prefix = "Single-token names compared as surnames. "
@@ -286,11 +423,10 @@ def verify_name_pair(target_name: str, candidate_name: str) -> VerificationResul
             reason=reason_prefix + surname_reason,
         )
 
-    target_first, target_surname, _ = split_name(target_tokens)
-    candidate_first, candidate_surname, _ = split_name(candidate_tokens)
-
-    first_score, first_reason = score_first_names(target_first, candidate_first)
-    surname_score, surname_reason = score_surnames(target_surname, candidate_surname)
+    first_score, first_reason = score_first_names(target_first, candidate_first, first_distance)
+    surname_score, surname_reason = score_surnames(
+        target_surname, candidate_surname, surname_distance
+    )
 
     combined_confidence = max(0.0, min(1.0, (first_score + surname_score) / 2.0))
     is_match = first_score >= 0.7 and surname_score >= 0.7
@@ -310,6 +446,48 @@ def verify_name_pair(target_name: str, candidate_name: str) -> VerificationResul
     )
 
 
+def verify_many(target_name: str, candidates: Sequence[str]) -> List[VerificationResult]:
+    """
+    Verify several candidate names against one target name.
+
+    Gives the same results as calling verify_name_pair for each candidate.
+    When RapidFuzz and NumPy are installed, the capped edit distances for
+    all first names and all surnames are computed in two batched calls.
+    """
+    if _Lev is None or not candidates:
+        return [verify_name_pair(target_name, candidate) for candidate in candidates]
+
+    # Imported here so single-name verification never pays for loading NumPy.
+    try:
+        import numpy  # noqa: F401 - rapidfuzz.process.cdist returns NumPy arrays
+        from rapidfuzz.process import cdist
+    except ImportError:
+        return [verify_name_pair(target_name, candidate) for candidate in candidates]
+
+    _, _, target_first, target_surname = analyze(target_name)
+    candidate_parts = [analyze(candidate) for candidate in candidates]
+
+    first_distances = cdist(
+        [target_first],
+        [first for _, _, first, _ in candidate_parts],
+        scorer=_Lev.distance,
+        score_cutoff=MAX_EDIT_DISTANCE,
+    )[0].tolist()
+    surname_distances = cdist(
+        [normalize_slavic_suffixes(target_surname)],
+        [normalize_slavic_suffixes(surname) for _, _, _, surname in candidate_parts],
+        scorer=_Lev.distance,
+        score_cutoff=MAX_EDIT_DISTANCE,
+    )[0].tolist()
+
+    return [
+        _verify_name_pair(target_name, candidate, first_distance, surname_distance)
+        for candidate, first_distance, surname_distance in zip(
+            candidates, first_distances, surname_distances
+        )
+    ]
+
+
 def verify_against_latest(candidate_name: str) -> dict:
     """
     Verify a candidate against the latest persisted target name.
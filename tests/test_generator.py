@@ -0,0 +1,42 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from name_verification import storage
+from name_verification.generator import generate_target_name
+
+
+def test_generate_target_name_is_deterministic(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "LATEST_TARGET_PATH", tmp_path / "latest_target.txt")
+
+    assert generate_target_name("hello") == "Jean-Luc Al-Hilal"
+    assert generate_target_name("hello") == "Jean-Luc Al-Hilal"
+    assert storage.read_latest_target() == "Jean-Luc Al-Hilal"
+
+
+def test_generate_target_name_ignores_hash_seed(tmp_path):
+    script = (
+        "import pathlib, sys\n"
+        "from name_verification import storage\n"
+        "from name_verification.generator import generate_target_name\n"
+        "storage.LATEST_TARGET_PATH = pathlib.Path(sys.argv[1])\n"
+        "print(generate_target_name('hello'))\n"
+    )
+    outputs = []
+    for hash_seed in ("1", "2"):
+        environment = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=str(PROJECT_ROOT))
+        completed = subprocess.run(
+            [sys.executable, "-c", script, str(tmp_path / f"latest_{hash_seed}.txt")],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=environment,
+        )
+        outputs.append(completed.stdout.strip())
+
+    assert outputs == ["Jean-Luc Al-Hilal", "Jean-Luc Al-Hilal"]
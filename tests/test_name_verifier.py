@@ -1,11 +1,19 @@
 import pathlib
 import sys
 
+import pytest
+
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from name_verification.verifier import verify_name_pair
+from name_verification import verifier
+from name_verification.verifier import (
+    levenshtein_distance,
+    levenshtein_distance_capped,
+    verify_many,
+    verify_name_pair,
+)
 
 
 def assert_match(target: str, candidate: str) -> None:
@@ -40,6 +48,13 @@ def test_expected_matches():
     assert_match("Sean O'Brien", "Shawn Obrien")
 
 
+def test_identical_names_match_without_normalization():
+    result = verify_name_pair("Tyler Bliha", "Tyler Bliha")
+    assert result.match
+    assert result.confidence == 0.99
+    assert result.reason == "Names are identical."
+
+
 def test_expected_non_matches():
     assert_non_match("Emanuel Oscar", "Belinda Oscar")
     assert_non_match("Michael Thompson", "Michelle Thompson")
@@ -53,3 +68,50 @@ def test_expected_non_matches():
     assert_non_match("Ivan Petrov", "Ilya Petrov")
     assert_non_match("Fatima Zahra", "Zahra Fatima")
     assert_non_match("William Carter", "Liam Carter")
+
+
+@pytest.fixture(params=["default", "pure_python"])
+def distance_backend(request, monkeypatch):
+    """
+    Run a test with the installed backend and again with the pure-Python
+    fallback, so the Myers code is covered even when RapidFuzz is present.
+    """
+    if request.param == "pure_python":
+        monkeypatch.setattr(verifier, "_Lev", None)
+    return request.param
+
+
+def test_levenshtein_distance(distance_backend):
+    assert levenshtein_distance("", "") == 0
+    assert levenshtein_distance("", "abc") == 3
+    assert levenshtein_distance("tyler", "tlyer") == 2
+    assert levenshtein_distance("kitten", "sitting") == 3
+    assert levenshtein_distance("gorbachov", "gorbachev") == 1
+    assert levenshtein_distance("a" * 70, "a" * 68 + "bc") == 2
+
+
+def test_levenshtein_distance_capped(distance_backend):
+    assert levenshtein_distance_capped("tyler", "tlyer") == 2
+    assert levenshtein_distance_capped("abdullah", "omar") == 3
+    assert levenshtein_distance_capped("kitten", "sitting", max_distance=2) == 3
+    assert levenshtein_distance_capped("kitten", "sitting", max_distance=3) == 3
+    assert levenshtein_distance_capped("a" * 70, "a" * 68 + "bc") == 2
+
+
+def test_verify_many_matches_pairwise_results(distance_backend):
+    candidates = ["Tlyer Bilha", "Bliha", "Tyler Blihaa", "Bliha Tyler", "Taylor Bliha", ""]
+    results = verify_many("Tyler Bliha", candidates)
+    assert results == [verify_name_pair("Tyler Bliha", candidate) for candidate in candidates]
+
+
+def test_verify_many_batched_path_matches_pairwise_results(monkeypatch):
+    pytest.importorskip("rapidfuzz")
+    pytest.importorskip("numpy")
+    candidates = ["Tlyer Bilha", "Tyler Blihaa", "Taylor Bliha", "Tyler Gorbachev", "Bliha"]
+    expected = [verify_name_pair("Tyler Bliha", candidate) for candidate in candidates]
+
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("verify_many should pass precomputed distances to the scorers")
+
+    monkeypatch.setattr(verifier, "levenshtein_distance_capped", fail_if_called)
+    assert verify_many("Tyler Bliha", candidates) == expected
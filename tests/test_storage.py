@@ -0,0 +1,25 @@
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from name_verification import storage
+
+
+def test_read_latest_target_tracks_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "LATEST_TARGET_PATH", tmp_path / "latest_target.txt")
+    monkeypatch.setattr(storage, "_latest_target_cache", None)
+
+    assert storage.read_latest_target() is None
+
+    storage.write_latest_target("Tyler Bliha")
+    assert storage.read_latest_target() == "Tyler Bliha"
+    assert storage.read_latest_target() == "Tyler Bliha"
+
+    storage.write_latest_target("Omar Al Saud")
+    assert storage.read_latest_target() == "Omar Al Saud"
+
+    storage.LATEST_TARGET_PATH.unlink()
+    assert storage.read_latest_target() is None